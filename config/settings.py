@@ -5,6 +5,7 @@ Centralized configuration management using environment variables.
 Configured for AWS-native services (Bedrock, OpenSearch Serverless).
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Optional
@@ -13,29 +14,50 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 
+@functools.cache
+def _load_environment() -> None:
+    """Parse the .env file into the process environment exactly once."""
+    load_dotenv()
+
+
 # Load environment variables from .env file
-load_dotenv()
+_load_environment()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """Web server configuration settings."""
     
     host: str = "0.0.0.0"
     port: int = 5000
     debug: bool = False
+    production: bool = False
+    threads: int = 8
+    backend: str = "waitress"
+    workers: int = 1
+    keep_alive: int = 75
+    behind_proxy: bool = False
+    max_request_bytes: int = 64 * 1024
     
     @classmethod
+    @functools.cache
     def from_environment(cls) -> "ServerConfig":
         """Load server config from environment variables."""
         return cls(
             host=os.getenv("SERVER_HOST", "0.0.0.0"),
             port=int(os.getenv("SERVER_PORT", "5000")),
-            debug=os.getenv("DEBUG_MODE", "false").lower() == "true"
+            debug=os.getenv("DEBUG_MODE", "false").lower() == "true",
+            production=os.getenv("PRODUCTION_MODE", "false").lower() == "true",
+            threads=int(os.getenv("SERVER_THREADS", "8")),
+            backend=os.getenv("SERVER_BACKEND", "waitress").lower(),
+            workers=int(os.getenv("SERVER_WORKERS", "1")),
+            keep_alive=int(os.getenv("SERVER_KEEP_ALIVE", "75")),
+            behind_proxy=os.getenv("BEHIND_PROXY", "false").lower() == "true",
+            max_request_bytes=int(os.getenv("MAX_REQUEST_BYTES", str(64 * 1024)))
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AWSConfig:
     """AWS services configuration."""
     
@@ -44,6 +66,7 @@ class AWSConfig:
     bedrock_model: str = "claude-3-sonnet"
     
     @classmethod
+    @functools.cache
     def from_environment(cls) -> "AWSConfig":
         """Load AWS config from environment variables."""
         return cls(
@@ -57,41 +80,58 @@ class AWSConfig:
         return bool(self.opensearch_endpoint)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VectorDBConfig:
-    """Vector database (OpenSearch) configuration settings."""
+    """Vector database (OpenSearch or local FAISS) configuration settings."""
     
     index_name: str = "healthai-knowledge-v1"
     vector_dimension: int = 384
+    backend: str = "aoss"
+    local_index_path: str = "vector_index"
     
     @classmethod
+    @functools.cache
     def from_environment(cls) -> "VectorDBConfig":
         """Load vector DB config from environment variables."""
         return cls(
             index_name=os.getenv("KNOWLEDGE_INDEX_NAME", "healthai-knowledge-v1"),
-            vector_dimension=int(os.getenv("VECTOR_DIMENSION", "384"))
+            vector_dimension=int(os.getenv("VECTOR_DIMENSION", "384")),
+            backend=os.getenv("VECTOR_BACKEND", "aoss").lower(),
+            local_index_path=os.getenv("LOCAL_INDEX_PATH", "vector_index")
         )
+    
+    @property
+    def is_local(self) -> bool:
+        """Return whether the index is a local FAISS index."""
+        return self.backend == "faiss"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Language model (Bedrock) configuration settings."""
     
     model_name: str = "claude-3-sonnet"
     temperature: float = 0.7
     max_tokens: int = 1024
+    response_cache_size: int = 0
+    response_cache_ttl: int = 3600
+    max_concurrency: int = 0
     
     @classmethod
+    @functools.cache
     def from_environment(cls) -> "LLMConfig":
         """Load LLM config from environment variables."""
         return cls(
             model_name=os.getenv("BEDROCK_MODEL", "claude-3-sonnet"),
             temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "1024"))
+            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "1024")),
+            response_cache_size=int(os.getenv("RESPONSE_CACHE_SIZE", "0")),
+            response_cache_ttl=int(os.getenv("RESPONSE_CACHE_TTL", "3600")),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "0"))
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """
     Master configuration container for all application settings.
@@ -101,6 +141,7 @@ class AppSettings:
     app_name: str = "HealthAI Assistant"
     version: str = "1.0.0"
     knowledge_base_path: str = "knowledge_base"
+    secret_key: str = field(default="", repr=False)
     
     server: ServerConfig = field(default_factory=ServerConfig)
     aws: AWSConfig = field(default_factory=AWSConfig)
@@ -108,10 +149,14 @@ class AppSettings:
     llm: LLMConfig = field(default_factory=LLMConfig)
     
     @classmethod
+    @functools.cache
     def load(cls) -> "AppSettings":
         """
         Load complete application settings from environment.
         
+        Values are materialized once and cached; use reload_settings()
+        to pick up environment changes.
+        
         Returns:
             Fully populated AppSettings instance.
         """
@@ -119,6 +164,7 @@ class AppSettings:
             app_name=os.getenv("APP_NAME", "HealthAI Assistant"),
             version=os.getenv("APP_VERSION", "1.0.0"),
             knowledge_base_path=os.getenv("KNOWLEDGE_PATH", "knowledge_base"),
+            secret_key=os.getenv("SECRET_KEY", ""),
             server=ServerConfig.from_environment(),
             aws=AWSConfig.from_environment(),
             database=VectorDBConfig.from_environment(),
@@ -133,7 +179,8 @@ class AppSettings:
             Dictionary with validation status for each section.
         """
         return {
-            "aws": self.aws.validate(),
+            # A local FAISS index doesn't need the OpenSearch endpoint
+            "aws": self.database.is_local or self.aws.validate(),
         }
     
     def get_knowledge_base_directory(self) -> Path:
@@ -167,5 +214,10 @@ def reload_settings() -> AppSettings:
     """
     global _settings
     load_dotenv(override=True)
+    
+    for config_class in (ServerConfig, AWSConfig, VectorDBConfig, LLMConfig):
+        config_class.from_environment.cache_clear()
+    AppSettings.load.cache_clear()
+    
     _settings = AppSettings.load()
     return _settings
@@ -6,15 +6,88 @@ Provides a clean interface for ingesting knowledge base materials.
 """
 
 import logging
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, NamedTuple
 
-from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
+import pypdfium2
 from langchain.schema import Document
 
 logger = logging.getLogger(__name__)
 
 
+class PageText(NamedTuple):
+    """
+    Raw text of a single page and the file it came from.
+
+    A lightweight stand-in for Document inside the extraction pipeline;
+    it is converted to a langchain Document only once, at the boundary.
+    """
+
+    text: str
+    source: str
+    page: int
+
+    def to_document(self) -> Document:
+        """Convert to a Document carrying the raw source and page metadata."""
+        return Document(
+            page_content=self.text,
+            metadata={"source": self.source, "page": self.page}
+        )
+
+    def to_sanitized_document(self) -> Document:
+        """Convert to a Document carrying only the (interned) origin path."""
+        return Document(
+            page_content=self.text,
+            metadata={"origin": sys.intern(self.source)}
+        )
+
+
+def _iter_pdf_pages(file_path: str) -> Iterator[PageText]:
+    """
+    Yield the text of each page in a PDF using PDFium.
+
+    Args:
+        file_path: Path to the PDF file.
+
+    Yields:
+        PageText records, one per page.
+    """
+    pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        for page_number in range(len(pdf)):
+            page = pdf[page_number]
+            text_page = page.get_textpage()
+            try:
+                page_text = text_page.get_text_range().replace("\r\n", "\n")
+            finally:
+                text_page.close()
+                page.close()
+            
+            yield PageText(page_text, file_path, page_number)
+    finally:
+        pdf.close()
+
+
+def _load_single_pdf(file_path: str) -> List[PageText]:
+    """
+    Extract all pages from a single PDF file.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Args:
+        file_path: Path to the PDF file.
+
+    Returns:
+        List of PageText records, one per page.
+    """
+    return list(_iter_pdf_pages(file_path))
+
+
 class DocumentLoader:
     """
     Responsible for loading documents from various sources.
@@ -42,6 +115,46 @@ class DocumentLoader:
                 f"Expected directory but found file: {self._source_path}"
             )
 
+    def _find_files(self, file_pattern: str) -> List[str]:
+        """Return matching file paths in a stable order."""
+        return sorted(str(path) for path in self._source_path.glob(file_pattern))
+
+    def _iter_pages(self, file_pattern: str) -> Iterator[PageText]:
+        """
+        Lazily yield pages from matching files, in file order.
+
+        Files are extracted in parallel by a process pool, but only a small
+        window of files is in flight at once, so memory stays bounded.
+        """
+        logger.info(f"Streaming documents from: {self._source_path}")
+        
+        file_paths = self._find_files(file_pattern)
+        if len(file_paths) <= 1:
+            for file_path in file_paths:
+                yield from _iter_pdf_pages(file_path)
+            return
+        
+        worker_count = min(os.cpu_count() or 1, len(file_paths))
+        remaining_paths = iter(file_paths)
+        
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            # Two files per worker keeps every worker busy while one is read
+            pending = deque(
+                executor.submit(_load_single_pdf, file_path)
+                for file_path in islice(remaining_paths, worker_count * 2)
+            )
+            try:
+                while pending:
+                    pages = pending.popleft().result()
+                    next_path = next(remaining_paths, None)
+                    if next_path is not None:
+                        pending.append(executor.submit(_load_single_pdf, next_path))
+                    yield from pages
+            finally:
+                # Stop queued work if the consumer abandons the stream
+                for future in pending:
+                    future.cancel()
+
     def extract_all_documents(self, file_pattern: str = "*.pdf") -> List[Document]:
         """
         Extract content from all matching documents in the source directory.
@@ -52,18 +165,20 @@ class DocumentLoader:
         Returns:
             List of Document objects containing extracted content.
         """
-        logger.info(f"Loading documents from: {self._source_path}")
-        
-        directory_reader = DirectoryLoader(
-            path=str(self._source_path),
-            glob=file_pattern,
-            loader_cls=PyPDFLoader
-        )
-        
-        extracted_docs = directory_reader.load()
-        logger.info(f"Successfully loaded {len(extracted_docs)} document pages")
-        
-        return extracted_docs
+        return [page.to_document() for page in self._iter_pages(file_pattern)]
+
+    def iter_sanitized_documents(self, file_pattern: str = "*.pdf") -> Iterator[Document]:
+        """
+        Lazily yield documents with metadata reduced to the origin path.
+
+        Args:
+            file_pattern: Glob pattern for file matching. Defaults to PDF files.
+
+        Yields:
+            Documents with streamlined metadata containing only source info.
+        """
+        for page in self._iter_pages(file_pattern):
+            yield page.to_sanitized_document()
 
     def sanitize_metadata(self, documents: List[Document]) -> List[Document]:
         """
@@ -78,7 +193,8 @@ class DocumentLoader:
         cleaned_documents: List[Document] = []
         
         for doc in documents:
-            origin_path = doc.metadata.get("source", "unknown")
+            # Interned so every page and chunk of a file shares one string
+            origin_path = sys.intern(doc.metadata.get("source", "unknown"))
             cleaned_doc = Document(
                 page_content=doc.page_content,
                 metadata={"origin": origin_path}
@@ -89,6 +205,20 @@ class DocumentLoader:
         return cleaned_documents
 
 
+def iter_knowledge_base(directory_path: str) -> Iterator[Document]:
+    """
+    Stream prepared documents from a directory without materializing them.
+
+    Args:
+        directory_path: Path to the knowledge base directory.
+
+    Yields:
+        Processed Document objects ready for segmentation.
+    """
+    loader = DocumentLoader(directory_path)
+    yield from loader.iter_sanitized_documents()
+
+
 def load_knowledge_base(directory_path: str) -> List[Document]:
     """
     Convenience function to load and prepare documents from a directory.
@@ -99,7 +229,4 @@ def load_knowledge_base(directory_path: str) -> List[Document]:
     Returns:
         List of processed Document objects ready for embedding.
     """
-    loader = DocumentLoader(directory_path)
-    raw_documents = loader.extract_all_documents()
-    prepared_documents = loader.sanitize_metadata(raw_documents)
-    return prepared_documents
+    return list(iter_knowledge_base(directory_path))
@@ -5,14 +5,37 @@ Provides vector embedding generation using transformer models.
 Wraps HuggingFace sentence transformers for semantic representation.
 """
 
+import importlib.util
 import logging
-from typing import List, Optional
+import os
+import platform
+import threading
+from functools import lru_cache
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional
 
+import numpy as np
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_core.embeddings import Embeddings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _cpu_flags() -> frozenset:
+    """Return the instruction-set flags reported for this CPU (Linux only)."""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith(("flags", "Features")):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+
 class EmbeddingGenerator:
     """
     Generates vector embeddings for text using pre-trained models.
@@ -23,45 +46,149 @@ class EmbeddingGenerator:
     DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
     VECTOR_DIMENSIONS = 384
 
-    _instance: Optional["EmbeddingGenerator"] = None
-    _embeddings_model: Optional[HuggingFaceEmbeddings] = None
+    # Large batches amortize tokenizer and kernel-launch overhead
+    DEFAULT_BATCH_SIZE = 256
 
-    def __new__(cls, model_identifier: str = None):
-        """Implement singleton pattern for resource efficiency."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    # Vectors are cached on disk keyed by a hash of the chunk text
+    DEFAULT_CACHE_DIRECTORY = ".embed_cache"
 
-    def __init__(self, model_identifier: str = None) -> None:
+    # Dynamically quantized int8 exports shipped with the MiniLM model repo,
+    # each tuned for one family of CPU instructions
+    QUANTIZED_ONNX_FILES = {
+        "arm64": "onnx/model_qint8_arm64.onnx",
+        "avx512_vnni": "onnx/model_qint8_avx512_vnni.onnx",
+        "avx512": "onnx/model_qint8_avx512.onnx",
+        "avx2": "onnx/model_quint8_avx2.onnx",
+    }
+
+    def __init__(
+        self,
+        model_identifier: str = None,
+        batch_size: int = None,
+        cache_directory: str = None,
+        quantized: bool = None
+    ) -> None:
         """
         Initialize the embedding generator.
 
         Args:
             model_identifier: HuggingFace model name. Uses default if not specified.
+            batch_size: Number of texts encoded per forward pass.
+            cache_directory: Directory for the persistent embedding cache.
+                Uses EMBEDDING_CACHE_DIR env var if not provided.
+            quantized: Run an int8 ONNX export through ONNX Runtime instead of
+                the FP32 PyTorch model. Uses EMBEDDING_QUANTIZED env var if
+                not provided.
         """
-        if self._initialized:
-            return
-            
         self._model_name = model_identifier or self.DEFAULT_MODEL
-        self._embeddings_model = None
-        self._initialized = True
+        self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self._cache_directory = cache_directory or os.getenv(
+            "EMBEDDING_CACHE_DIR", self.DEFAULT_CACHE_DIRECTORY
+        )
+        if quantized is None:
+            quantized = os.getenv("EMBEDDING_QUANTIZED", "false").lower() == "true"
+        self._quantized = quantized
+        self._embeddings_model: Optional[Embeddings] = None
+        self._init_lock = threading.Lock()
+
+    def _build_model_kwargs(self) -> Dict[str, Any]:
+        """Select the SentenceTransformer backend for the configured precision."""
+        if not self._quantized:
+            return {}
+        
+        if importlib.util.find_spec("onnxruntime") is None:
+            logger.warning(
+                "onnxruntime is not installed; falling back to FP32 embeddings. "
+                "Install with: pip install 'sentence-transformers[onnx]'"
+            )
+            return {}
+        
+        file_name = self._select_quantized_file()
+        logger.info(f"Using quantized ONNX model: {file_name}")
+        return {
+            "backend": "onnx",
+            "model_kwargs": {"file_name": file_name}
+        }
+
+    def _select_quantized_file(self) -> str:
+        """
+        Pick the int8 export matching this CPU.
+
+        VNNI cores get the avx512_vnni build, which uses the fused int8
+        dot-product instructions; other CPUs fall back to the closest
+        variant they can execute.
+        """
+        if platform.machine().lower() in ("arm64", "aarch64"):
+            return self.QUANTIZED_ONNX_FILES["arm64"]
+        
+        flags = _cpu_flags()
+        if "avx512_vnni" in flags or "avx512vnni" in flags:
+            return self.QUANTIZED_ONNX_FILES["avx512_vnni"]
+        if "avx512f" in flags:
+            return self.QUANTIZED_ONNX_FILES["avx512"]
+        return self.QUANTIZED_ONNX_FILES["avx2"]
+
+    def _cache_namespace(self, model_kwargs: Dict[str, Any]) -> str:
+        """
+        Build the embedding cache namespace for the loaded model variant.
+
+        FP32 and each int8 export produce slightly different vectors, so
+        they must not share cache entries.
+        """
+        onnx_file = model_kwargs.get("model_kwargs", {}).get("file_name")
+        variant = PurePosixPath(onnx_file).stem if onnx_file else "fp32"
+        return f"{self._model_name}/{variant}"
 
     def _ensure_model_loaded(self) -> None:
-        """Lazily load the embedding model on first use."""
-        if self._embeddings_model is None:
+        """Lazily load the embedding model on first use (thread-safe)."""
+        if self._embeddings_model is not None:
+            return
+        
+        with self._init_lock:
+            if self._embeddings_model is not None:
+                return
+            
             logger.info(f"Initializing embedding model: {self._model_name}")
-            self._embeddings_model = HuggingFaceEmbeddings(
-                model_name=self._model_name
+            model_kwargs = self._build_model_kwargs()
+            base_model = HuggingFaceEmbeddings(
+                model_name=self._model_name,
+                model_kwargs=model_kwargs,
+                encode_kwargs={
+                    "batch_size": self._batch_size,
+                    "normalize_embeddings": True
+                },
+                # The wrapper passes this to encode() as show_progress_bar
+                show_progress=False
+            )
+        
+            # Only unseen chunk texts reach the model on re-ingestion
+            self._embeddings_model = CacheBackedEmbeddings.from_bytes_store(
+                base_model,
+                LocalFileStore(self._cache_directory),
+                namespace=self._cache_namespace(model_kwargs),
+                batch_size=self._batch_size,
+                key_encoder="sha256"
             )
-            logger.info("Embedding model ready")
+            logger.info(
+                f"Embedding model ready (cache: {self._cache_directory})"
+            )
+
+    def warmup(self) -> None:
+        """
+        Load the model and run one inference so later calls are not delayed.
 
-    def get_embeddings_interface(self) -> HuggingFaceEmbeddings:
+        Intended to be called once at application startup.
+        """
+        self._ensure_model_loaded()
+        self._embeddings_model.embed_query("warmup")
+        logger.debug("Embedding model warmed up")
+
+    def get_embeddings_interface(self) -> Embeddings:
         """
         Get the underlying embeddings interface for integration with vector stores.
 
         Returns:
-            HuggingFaceEmbeddings instance ready for use.
+            Cache-backed embeddings instance ready for use.
         """
         self._ensure_model_loaded()
         return self._embeddings_model
@@ -79,18 +206,45 @@ class EmbeddingGenerator:
         self._ensure_model_loaded()
         return self._embeddings_model.embed_query(text)
 
-    def generate_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for multiple texts efficiently.
 
+        Texts are encoded in batches of ``batch_size`` per forward pass.
+        Duplicate texts are encoded once and texts already present in the
+        embedding cache are not re-encoded.
+
         Args:
             texts: List of texts to embed.
 
         Returns:
-            List of embedding vectors.
+            Contiguous float32 array of shape (len(texts), dimensions).
+            Call ``.tolist()`` where plain Python lists are required.
         """
+        if not texts:
+            return np.empty((0, self.dimensions), dtype=np.float32)
+        
         self._ensure_model_loaded()
-        return self._embeddings_model.embed_documents(texts)
+        
+        # Boilerplate (headers, disclaimers) often repeats across chunks
+        unique_positions = {}
+        for text in texts:
+            unique_positions.setdefault(text, len(unique_positions))
+        
+        vectors = np.asarray(
+            self._embeddings_model.embed_documents(list(unique_positions)),
+            dtype=np.float32
+        )
+        
+        if len(unique_positions) == len(texts):
+            return vectors
+        
+        logger.debug(
+            "Embedded %d unique texts for %d inputs",
+            len(unique_positions),
+            len(texts)
+        )
+        return vectors[[unique_positions[text] for text in texts]]
 
     @property
     def dimensions(self) -> int:
@@ -103,11 +257,20 @@ class EmbeddingGenerator:
         return self._model_name
 
 
-def get_embedding_service() -> EmbeddingGenerator:
+@lru_cache(maxsize=8)
+def get_embedding_service(
+    model_identifier: str = EmbeddingGenerator.DEFAULT_MODEL
+) -> EmbeddingGenerator:
     """
-    Factory function to obtain the embedding service instance.
+    Factory function to obtain the embedding service for a model.
+
+    Instances are cached per model, so the heavy model is loaded once and
+    requesting a different model returns a distinct generator.
+
+    Args:
+        model_identifier: HuggingFace model name.
 
     Returns:
-        Singleton EmbeddingGenerator instance.
+        Shared EmbeddingGenerator instance for the model.
     """
-    return EmbeddingGenerator()
+    return EmbeddingGenerator(model_identifier)
@@ -6,22 +6,77 @@ Splits large documents into digestible chunks while preserving context.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from typing import Any, Iterable, Iterator, List, Optional
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# Characters of chunk text shown as a source preview in API responses
+PREVIEW_LENGTH = 200
+
 
 @dataclass
 class ChunkingConfig:
-    """Configuration parameters for text chunking."""
+    """
+    Configuration parameters for text chunking.
+
+    Sizes are measured in tokens of ``tokenizer_model`` when
+    ``length_function`` is "token", otherwise in characters. The defaults
+    fill MiniLM's 256-token context, less the [CLS] and [SEP] tokens the
+    model adds, with a 10% overlap.
+    """
+    
+    segment_size: int = 254
+    overlap_size: int = 26
+    length_function: str = "token"
+    tokenizer_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=4)
+def _load_tokenizer(model_name: str) -> Optional[Any]:
+    """Load a HuggingFace fast tokenizer, or None if transformers is missing."""
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.warning(
+            "transformers is not installed; falling back to character-based chunking"
+        )
+        return None
+    
+    return AutoTokenizer.from_pretrained(model_name)
+
+
+def _build_splitter(config: ChunkingConfig) -> RecursiveCharacterTextSplitter:
+    """Build a text splitter from a chunking configuration."""
+    if config.length_function == "token":
+        tokenizer = _load_tokenizer(config.tokenizer_model)
+        if tokenizer is not None:
+            return RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
+                tokenizer,
+                chunk_size=config.segment_size,
+                chunk_overlap=config.overlap_size
+            )
     
-    segment_size: int = 500
-    overlap_size: int = 50
-    length_function: str = "character"
+    return RecursiveCharacterTextSplitter(
+        chunk_size=config.segment_size,
+        chunk_overlap=config.overlap_size
+    )
+
+
+def _split_shard(config: ChunkingConfig, documents: List[Document]) -> List[Document]:
+    """
+    Split one shard of documents inside a worker process.
+
+    Defined at module level so it can be pickled into worker processes.
+    """
+    return _build_splitter(config).split_documents(documents)
 
 
 class TextSegmenter:
@@ -30,6 +85,9 @@ class TextSegmenter:
     embedding-friendly chunks.
     """
 
+    # Below this many documents, process start-up costs more than it saves
+    PARALLEL_THRESHOLD = 500
+
     def __init__(self, config: ChunkingConfig = None) -> None:
         """
         Initialize the text segmenter with optional configuration.
@@ -42,17 +100,23 @@ class TextSegmenter:
 
     def _create_splitter(self) -> RecursiveCharacterTextSplitter:
         """Build the underlying text splitter with current configuration."""
-        return RecursiveCharacterTextSplitter(
-            chunk_size=self._config.segment_size,
-            chunk_overlap=self._config.overlap_size
-        )
+        return _build_splitter(self._config)
 
-    def segment_documents(self, documents: List[Document]) -> List[Document]:
+    def segment_documents(
+        self,
+        documents: List[Document],
+        executor: Optional[ProcessPoolExecutor] = None
+    ) -> List[Document]:
         """
         Split documents into smaller chunks suitable for embedding.
 
+        Large inputs are split across a process pool; chunk order matches
+        the input order either way.
+
         Args:
             documents: List of documents to segment.
+            executor: Process pool to reuse for large inputs. A temporary
+                pool is created per call when not provided.
 
         Returns:
             List of chunked Document objects.
@@ -61,7 +125,13 @@ class TextSegmenter:
             logger.warning("No documents provided for segmentation")
             return []
 
-        segmented = self._splitter.split_documents(documents)
+        worker_count = os.cpu_count() or 1
+        if len(documents) > self.PARALLEL_THRESHOLD and worker_count > 1:
+            segmented = self._segment_in_parallel(
+                documents, worker_count, executor
+            )
+        else:
+            segmented = self._splitter.split_documents(documents)
         
         logger.info(
             f"Segmented {len(documents)} documents into {len(segmented)} chunks"
@@ -69,34 +139,120 @@ class TextSegmenter:
         
         return segmented
 
+    def _segment_in_parallel(
+        self,
+        documents: List[Document],
+        worker_count: int,
+        executor: Optional[ProcessPoolExecutor] = None
+    ) -> List[Document]:
+        """Split documents in equal contiguous shards across worker processes."""
+        shard_size = -(-len(documents) // worker_count)
+        shards = [
+            documents[start:start + shard_size]
+            for start in range(0, len(documents), shard_size)
+        ]
+        
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+                return self._segment_in_parallel(documents, worker_count, pool)
+        
+        results = executor.map(_split_shard, repeat(self._config), shards)
+        return list(chain.from_iterable(results))
+
     def update_configuration(self, new_config: ChunkingConfig) -> None:
         """
         Update chunking configuration and rebuild the splitter.
 
+        The splitter is only rebuilt when the configuration actually changes.
+
         Args:
             new_config: New configuration to apply.
         """
+        if new_config == self._config:
+            return
+        
         self._config = new_config
         self._splitter = self._create_splitter()
         logger.debug(f"Updated chunking config: size={new_config.segment_size}")
 
 
+@lru_cache(maxsize=32)
+def _get_segmenter(segment_size: int, overlap: int) -> TextSegmenter:
+    """Return a shared segmenter for the given chunking parameters."""
+    config = ChunkingConfig(segment_size=segment_size, overlap_size=overlap)
+    return TextSegmenter(config)
+
+
 def create_text_segments(
     documents: List[Document],
-    segment_size: int = 500,
-    overlap: int = 50
+    segment_size: int = 254,
+    overlap: int = 26
 ) -> List[Document]:
     """
     Convenience function for quick document segmentation.
 
     Args:
         documents: Documents to segment.
-        segment_size: Target size for each chunk.
-        overlap: Number of characters to overlap between chunks.
+        segment_size: Target size for each chunk, in tokens.
+        overlap: Number of tokens to overlap between chunks.
 
     Returns:
         List of segmented Document objects.
     """
-    config = ChunkingConfig(segment_size=segment_size, overlap_size=overlap)
-    segmenter = TextSegmenter(config)
-    return segmenter.segment_documents(documents)
+    return _get_segmenter(segment_size, overlap).segment_documents(documents)
+
+
+def iter_text_segments(
+    documents: Iterable[Document],
+    segment_size: int = 254,
+    overlap: int = 26,
+    flush_every: int = 1000
+) -> Iterator[Document]:
+    """
+    Segment a stream of documents, flushing chunks in bounded batches.
+
+    At most ``flush_every`` source documents are buffered at a time, so
+    memory stays constant regardless of corpus size. One process pool is
+    started for the whole stream and reused by every batch.
+
+    Args:
+        documents: Documents to segment, typically a generator.
+        segment_size: Target size for each chunk, in tokens.
+        overlap: Number of tokens to overlap between chunks.
+        flush_every: Number of source documents segmented per batch.
+
+    Yields:
+        Segmented Document objects.
+    """
+    segmenter = _get_segmenter(segment_size, overlap)
+    source = iter(documents)
+    
+    # Workers are spawned on first use, so small streams never start any
+    with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        while True:
+            batch = list(islice(source, flush_every))
+            if not batch:
+                break
+            yield from segmenter.segment_documents(batch, executor)
+
+
+def attach_previews(
+    documents: Iterable[Document],
+    preview_length: int = PREVIEW_LENGTH
+) -> Iterator[Document]:
+    """
+    Store a short content preview in each document's metadata.
+
+    Computed once at indexing time so responses can read it directly
+    instead of slicing chunk text per request.
+
+    Args:
+        documents: Chunks to annotate, typically a generator.
+        preview_length: Number of leading characters to keep.
+
+    Yields:
+        The same chunks, annotated in place.
+    """
+    for doc in documents:
+        doc.metadata["preview"] = doc.page_content[:preview_length] + "..."
+        yield doc
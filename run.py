@@ -1,28 +1,140 @@
 """
 HealthAI Assistant - Application Entry Point
 --------------------------------------------
-Run this script to start the development server.
+Run this script to start the development server, or pass --prod to
+serve through a production server (waitress by default, uvicorn or granian).
 """
 
+import argparse
+import importlib.util
 import sys
 import os
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from web.server import create_application, run_development_server
-from config.settings import get_settings
+SERVER_BACKENDS = ("waitress", "uvicorn", "granian")
+
+
+def _parse_arguments() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Run the HealthAI Assistant server")
+    parser.add_argument(
+        "--prod",
+        action="store_true",
+        help="Serve with a production server instead of the Flask dev server"
+    )
+    parser.add_argument(
+        "--server",
+        choices=SERVER_BACKENDS,
+        help="Production server to use (implies --prod; default: SERVER_BACKEND)"
+    )
+    return parser.parse_args()
+
+
+def _serve_with_waitress(settings) -> None:
+    """Serve the application through the multi-threaded waitress WSGI server."""
+    from waitress import serve
+    from web.server import create_application
+    
+    serve(
+        create_application(),
+        host=settings.server.host,
+        port=settings.server.port,
+        threads=settings.server.threads
+    )
+
+
+def _select_uvicorn_implementations() -> tuple:
+    """
+    Choose uvicorn's event loop and HTTP parser.
+
+    Prefers the libuv-based uvloop (POSIX only) and the C httptools parser,
+    falling back to the pure-Python defaults when they are not installed.
+    """
+    use_uvloop = (
+        sys.platform != "win32"
+        and importlib.util.find_spec("uvloop") is not None
+    )
+    use_httptools = importlib.util.find_spec("httptools") is not None
+    
+    return (
+        "uvloop" if use_uvloop else "asyncio",
+        "httptools" if use_httptools else "h11"
+    )
+
+
+def _serve_with_uvicorn(settings) -> None:
+    """Serve the application through uvicorn via the ASGI adapter."""
+    import uvicorn
+    
+    loop, http = _select_uvicorn_implementations()
+    
+    # An import string lets uvicorn build the app in each worker process.
+    # uvicorn renders the Date header once per second rather than per
+    # response; idle connections outlive a typical proxy's keep-alive.
+    uvicorn.run(
+        "web.server:create_asgi_application",
+        factory=True,
+        host=settings.server.host,
+        port=settings.server.port,
+        workers=settings.server.workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=settings.server.keep_alive,
+        log_level="info"
+    )
+
+
+def _serve_with_granian(settings) -> None:
+    """Serve the Flask app through Granian's Rust HTTP stack over WSGI."""
+    from granian import Granian
+    from granian.constants import Interfaces
+    
+    Granian(
+        "web.server:create_application",
+        factory=True,
+        address=settings.server.host,
+        port=settings.server.port,
+        interface=Interfaces.WSGI,
+        workers=settings.server.workers,
+        blocking_threads=settings.server.threads
+    ).serve()
+
+
+def _run_production_server(settings, backend: str) -> None:
+    """Serve the application through the selected production server."""
+    if backend not in SERVER_BACKENDS:
+        raise SystemExit(
+            f"Unknown server backend '{backend}'. "
+            f"Choose one of: {', '.join(SERVER_BACKENDS)}"
+        )
+    
+    if backend == "uvicorn":
+        _serve_with_uvicorn(settings)
+    elif backend == "granian":
+        _serve_with_granian(settings)
+    else:
+        _serve_with_waitress(settings)
 
 
 def main():
     """Application entry point."""
+    arguments = _parse_arguments()
+    
+    # Deferred so the banner prints before Flask and langchain are imported
+    from config.settings import get_settings
+    
     settings = get_settings()
+    production = arguments.prod or bool(arguments.server) or settings.server.production
+    backend = arguments.server or settings.server.backend
+    server_kind = "production" if production else "development"
     
     print(f"""
     ╔══════════════════════════════════════════════════════╗
     ║         HealthAI Assistant v{settings.version}                ║
     ╠══════════════════════════════════════════════════════╣
-    ║  Starting development server...                      ║
+    ║  Starting {server_kind:<11} server...                      ║
     ║  Access the application at:                          ║
     ║  http://{settings.server.host}:{settings.server.port}                            ║
     ╚══════════════════════════════════════════════════════╝
@@ -38,6 +150,12 @@ def main():
             print(f"    {status} {key.upper()}")
         print("\n    Please check your .env file.\n")
     
+    if production:
+        _run_production_server(settings, backend)
+        return
+    
+    from web.server import run_development_server
+    
     run_development_server()
 
 
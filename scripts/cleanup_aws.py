@@ -14,115 +14,177 @@ Requirements:
 """
 
 import argparse
+import os
+import random
 import time
 import sys
 
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 try:
     import boto3
     from botocore.exceptions import ClientError
+    
+    from services._aws import SHARED_CLIENT_CONFIG
 except ImportError:
     print("ERROR: boto3 is required. Install it with: pip install boto3")
     sys.exit(1)
 
 
+def log(message: str) -> None:
+    """Print a line of progress output."""
+    print(message)
+
+
 def delete_cloudformation_stack(stack_name: str, region: str) -> bool:
     """
     Delete CloudFormation stack and wait for completion.
     This will delete EC2, IAM roles, Security Groups automatically.
     """
-    cf_client = boto3.client("cloudformation", region_name=region)
+    cf_client = boto3.client("cloudformation", region_name=region, config=SHARED_CLIENT_CONFIG)
     
-    print(f"\n🗑️  Deleting CloudFormation stack: {stack_name}")
-    print("   This will delete: EC2 instance, IAM roles, Security Groups")
+    log(f"\n🗑️  Deleting CloudFormation stack: {stack_name}")
+    log("   This will delete: EC2 instance, IAM roles, Security Groups")
     
     try:
         cf_client.delete_stack(StackName=stack_name)
-        print("   Stack deletion initiated...")
+        log("   Stack deletion initiated...")
         
         # Wait for deletion
         waiter = cf_client.get_waiter("stack_delete_complete")
-        print("   Waiting for deletion to complete (this may take a few minutes)...")
+        log("   Waiting for deletion to complete (this may take a few minutes)...")
         waiter.wait(StackName=stack_name)
-        print("   ✅ Stack deleted successfully!")
+        log("   ✅ Stack deleted successfully!")
         return True
         
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
         if error_code == "ValidationError" and "does not exist" in str(e):
-            print(f"   ⚠️  Stack '{stack_name}' does not exist or already deleted.")
+            log(f"   ⚠️  Stack '{stack_name}' does not exist or already deleted.")
             return True
-        print(f"   ❌ Error deleting stack: {e}")
+        log(f"   ❌ Error deleting stack: {e}")
         return False
 
 
+def wait_with_backoff(is_done, timeout: float = 300, base: float = 0.5, cap: float = 20) -> bool:
+    """
+    Poll ``is_done`` with exponential backoff and jitter until it returns True.
+
+    Polls start tight and widen up to ``cap`` seconds apart, so fast
+    operations return quickly while slow ones are not hammered.
+
+    Returns:
+        True if ``is_done`` succeeded before ``timeout`` seconds elapsed.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    
+    while time.monotonic() < deadline:
+        if is_done():
+            return True
+        delay = min(cap, base * 2 ** attempt) + random.uniform(0, base)
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        attempt += 1
+    
+    return is_done()
+
+
 def delete_opensearch_collection(collection_name: str, region: str) -> bool:
     """
     Delete OpenSearch Serverless collection.
     Note: CloudFormation should handle this, but this is a backup.
     """
     try:
-        aoss_client = boto3.client("opensearchserverless", region_name=region)
+        aoss_client = boto3.client("opensearchserverless", region_name=region, config=SHARED_CLIENT_CONFIG)
         
-        print(f"\n🗑️  Checking OpenSearch collection: {collection_name}")
+        log(f"\n🗑️  Checking OpenSearch collection: {collection_name}")
         
         # Check if collection exists
         try:
             response = aoss_client.batch_get_collection(names=[collection_name])
             if not response.get("collectionDetails"):
-                print("   ⚠️  Collection does not exist or already deleted.")
+                log("   ⚠️  Collection does not exist or already deleted.")
                 return True
         except ClientError:
-            print("   ⚠️  Collection not found.")
+            log("   ⚠️  Collection not found.")
             return True
         
         # Delete collection
         aoss_client.delete_collection(id=response["collectionDetails"][0]["id"])
-        print("   ✅ Collection deletion initiated!")
+        log("   ✅ Collection deletion initiated!")
         
         # Wait for deletion
-        print("   Waiting for collection deletion...")
-        for _ in range(30):  # Wait up to 5 minutes
-            time.sleep(10)
+        log("   Waiting for collection deletion...")
+        
+        # Listing by name returns a slim summary instead of full details
+        def collection_gone() -> bool:
             try:
-                response = aoss_client.batch_get_collection(names=[collection_name])
-                if not response.get("collectionDetails"):
-                    print("   ✅ Collection deleted successfully!")
-                    return True
+                response = aoss_client.list_collections(
+                    collectionFilters={"name": collection_name}
+                )
             except ClientError:
-                print("   ✅ Collection deleted successfully!")
                 return True
+            return not response.get("collectionSummaries")
+        
+        if wait_with_backoff(collection_gone, timeout=300):  # Wait up to 5 minutes
+            log("   ✅ Collection deleted successfully!")
+            return True
         
-        print("   ⚠️  Collection deletion is taking longer than expected. Check AWS Console.")
+        log("   ⚠️  Collection deletion is taking longer than expected. Check AWS Console.")
         return False
         
     except ClientError as e:
-        print(f"   ❌ Error: {e}")
+        log(f"   ❌ Error: {e}")
         return False
 
 
+def opensearch_collection_exists(collection_name: str, region: str) -> bool:
+    """Return True if the OpenSearch collection still exists (or cannot be checked)."""
+    try:
+        aoss_client = boto3.client("opensearchserverless", region_name=region, config=SHARED_CLIENT_CONFIG)
+        response = aoss_client.list_collections(
+            collectionFilters={"name": collection_name}
+        )
+    except ClientError:
+        return True
+    return bool(response.get("collectionSummaries"))
+
+
 def delete_security_policies(region: str) -> None:
     """Delete OpenSearch Serverless security policies."""
     try:
-        aoss_client = boto3.client("opensearchserverless", region_name=region)
+        aoss_client = boto3.client("opensearchserverless", region_name=region, config=SHARED_CLIENT_CONFIG)
         
-        print("\n🗑️  Cleaning up OpenSearch security policies...")
+        log("\n🗑️  Cleaning up OpenSearch security policies...")
         
         # Delete encryption policy
         try:
             aoss_client.delete_security_policy(name="healthai-encryption", type="encryption")
-            print("   ✅ Deleted encryption policy")
+            log("   ✅ Deleted encryption policy")
         except ClientError:
-            print("   ⚠️  Encryption policy not found or already deleted")
+            log("   ⚠️  Encryption policy not found or already deleted")
         
         # Delete network policy
         try:
             aoss_client.delete_security_policy(name="healthai-network", type="network")
-            print("   ✅ Deleted network policy")
+            log("   ✅ Deleted network policy")
         except ClientError:
-            print("   ⚠️  Network policy not found or already deleted")
+            log("   ⚠️  Network policy not found or already deleted")
             
     except Exception as e:
-        print(f"   ⚠️  Could not clean up policies: {e}")
+        log(f"   ⚠️  Could not clean up policies: {e}")
+
+
+def delete_opensearch_resources(collection_name: str, region: str) -> None:
+    """
+    Delete the OpenSearch collection, then its security policies.
+
+    Policies cannot be removed while a collection still uses them, so these
+    two steps stay sequential.
+    """
+    delete_opensearch_collection(collection_name, region)
+    delete_security_policies(region)
 
 
 def estimate_cost_savings():
@@ -169,14 +231,14 @@ def main():
             print("\n❌ Cleanup cancelled.")
             sys.exit(0)
     
-    # Delete CloudFormation stack (handles most resources)
+    # Delete CloudFormation stack (handles most resources, including the
+    # OpenSearch collection and its security policies)
     stack_deleted = delete_cloudformation_stack(args.stack_name, args.region)
     
-    # Clean up OpenSearch collection (backup if CF fails)
-    delete_opensearch_collection("healthai-knowledge", args.region)
-    
-    # Clean up security policies
-    delete_security_policies(args.region)
+    # Clean up OpenSearch directly only as a backup if CF left it behind
+    collection_name = "healthai-knowledge"
+    if not stack_deleted or opensearch_collection_exists(collection_name, args.region):
+        delete_opensearch_resources(collection_name, args.region)
     
     # Summary
     print("\n" + "=" * 60)
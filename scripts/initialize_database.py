@@ -7,17 +7,33 @@ Run this once before starting the application.
 
 import sys
 import os
+from typing import Iterable, Iterator, TypeVar
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
 
-from core.document_processor import load_knowledge_base
-from core.text_chunker import create_text_segments
+from core.document_processor import iter_knowledge_base
+from core.text_chunker import attach_previews, iter_text_segments
 from services.vector_database import initialize_knowledge_base
 from config.settings import get_settings
 
+ItemT = TypeVar("ItemT")
+
+
+class StreamCounter:
+    """Count items as they pass through a generator pipeline."""
+
+    def __init__(self) -> None:
+        self.total = 0
+
+    def track(self, items: Iterable[ItemT]) -> Iterator[ItemT]:
+        """Yield items unchanged, counting each one."""
+        for item in items:
+            self.total += 1
+            yield item
+
 
 def main():
     """Initialize the knowledge base with documents in AWS OpenSearch."""
@@ -31,7 +47,7 @@ def main():
     """)
     
     # Validate AWS configuration
-    if not settings.aws.validate():
+    if not settings.database.is_local and not settings.aws.validate():
         print("❌ Error: OPENSEARCH_ENDPOINT not found in environment.")
         print("   Please configure your .env file with AWS settings.")
         print("\n   Required:")
@@ -45,33 +61,41 @@ def main():
     knowledge_path = settings.knowledge_base_path
     index_name = settings.database.index_name
     
-    print(f"☁️  AWS Region: {settings.aws.region}")
-    print(f"🔍 OpenSearch Endpoint: {settings.aws.opensearch_endpoint[:50]}...")
+    if settings.database.is_local:
+        storage = "Local FAISS index"
+        print(f"💾 Local index path: {settings.database.local_index_path}")
+    else:
+        storage = "AWS OpenSearch Serverless"
+        print(f"☁️  AWS Region: {settings.aws.region}")
+        print(f"🔍 OpenSearch Endpoint: {settings.aws.opensearch_endpoint[:50]}...")
     print(f"📁 Loading documents from: {knowledge_path}")
     
-    # Load and process documents
-    documents = load_knowledge_base(knowledge_path)
-    print(f"   ✓ Loaded {len(documents)} document pages")
+    # Pages are loaded, segmented and indexed lazily, so only one
+    # embedding batch is held in memory at a time
+    page_counter = StreamCounter()
+    chunk_counter = StreamCounter()
     
-    # Create text chunks
-    print(f"\n📄 Segmenting documents...")
-    chunks = create_text_segments(documents, segment_size=500, overlap=50)
-    print(f"   ✓ Created {len(chunks)} text segments")
+    documents = page_counter.track(iter_knowledge_base(knowledge_path))
+    chunks = chunk_counter.track(attach_previews(
+        iter_text_segments(documents, segment_size=254, overlap=26)
+    ))
     
     # Initialize vector store in OpenSearch
-    print(f"\n🔄 Initializing OpenSearch index: {index_name}")
+    print(f"\n🔄 Loading, segmenting and indexing into: {index_name}")
     print("   This may take several minutes...")
     
     store = initialize_knowledge_base(index_name, chunks)
+    print(f"   ✓ Indexed {chunk_counter.total} text segments "
+          f"from {page_counter.total} document pages")
     
     print(f"""
     ╔══════════════════════════════════════════════════════╗
     ║  ✅ Knowledge base initialization complete!          ║
     ╠══════════════════════════════════════════════════════╣
     ║  Index Name : {index_name:<38} ║
-    ║  Documents  : {len(documents):<38} ║
-    ║  Chunks     : {len(chunks):<38} ║
-    ║  Storage    : AWS OpenSearch Serverless              ║
+    ║  Documents  : {page_counter.total:<38} ║
+    ║  Chunks     : {chunk_counter.total:<38} ║
+    ║  Storage    : {storage:<38} ║
     ╚══════════════════════════════════════════════════════╝
     
     You can now run the application with: python run.py
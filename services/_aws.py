@@ -0,0 +1,36 @@
+"""
+AWS Client Configuration
+------------------------
+Shared botocore settings applied to every AWS client in the application.
+Uses adaptive retries so throttled calls back off instead of storming.
+"""
+
+from botocore.config import Config
+
+
+DEFAULT_MAX_ATTEMPTS = 10
+
+# Bedrock throttles aggressively under load, so allow more attempts
+BEDROCK_MAX_ATTEMPTS = 15
+
+
+def build_client_config(max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Config:
+    """
+    Build a botocore client config with adaptive retries and bounded timeouts.
+
+    Args:
+        max_attempts: Total attempts per request, including the first call.
+
+    Returns:
+        Config to pass as ``config=`` to ``boto3.client``.
+    """
+    return Config(
+        retries={"mode": "adaptive", "max_attempts": max_attempts},
+        connect_timeout=5,
+        read_timeout=60,
+        max_pool_connections=50
+    )
+
+
+SHARED_CLIENT_CONFIG = build_client_config()
+BEDROCK_CLIENT_CONFIG = build_client_config(BEDROCK_MAX_ATTEMPTS)
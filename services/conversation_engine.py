@@ -7,7 +7,8 @@ Orchestrates retrieval and response generation for user queries.
 
 import logging
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional
 
 import boto3
 from langchain_aws import ChatBedrock
@@ -15,11 +16,34 @@ from langchain.chains import create_retrieval_chain
 from langchain.chains.combine_documents import create_stuff_documents_chain
 from langchain_core.prompts import ChatPromptTemplate
 
+from services._aws import BEDROCK_CLIENT_CONFIG
+from services.response_cache import ResponseCache, normalize_query
 from services.vector_database import KnowledgeStore
 from config.prompts import ASSISTANT_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Immutable, so one compiled template is shared by every responder
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", ASSISTANT_SYSTEM_PROMPT),
+    ("human", "{input}")
+])
+
+
+@lru_cache(maxsize=4)
+def _get_bedrock_client(region: str):
+    """
+    Return the process-wide Bedrock runtime client for a region.
+
+    boto3 clients are thread-safe, so every responder shares one client and
+    its warm connection pool instead of building its own.
+    """
+    return boto3.client(
+        service_name="bedrock-runtime",
+        region_name=region,
+        config=BEDROCK_CLIENT_CONFIG
+    )
+
 
 class IntelligentResponder:
     """
@@ -43,7 +67,9 @@ class IntelligentResponder:
         self,
         knowledge_store: KnowledgeStore,
         model_name: str = None,
-        aws_region: str = None
+        aws_region: str = None,
+        cache_size: int = 0,
+        cache_ttl: float = 3600
     ) -> None:
         """
         Initialize the conversation engine with Bedrock.
@@ -52,8 +78,12 @@ class IntelligentResponder:
             knowledge_store: Connected knowledge store for retrieval.
             model_name: Bedrock model identifier. Defaults to Claude 3 Sonnet.
             aws_region: AWS region for Bedrock. Uses env var if not provided.
+            cache_size: Number of answers to cache for repeated questions.
+                Disabled (0) by default, since sampled answers vary.
+            cache_ttl: Seconds a cached answer stays valid.
         """
         self._knowledge_store = knowledge_store
+        self._response_cache: ResponseCache[str] = ResponseCache(cache_size, cache_ttl)
         self._region = aws_region or os.getenv("AWS_REGION", "us-east-1")
         
         # Resolve model name
@@ -67,14 +97,8 @@ class IntelligentResponder:
 
     def _initialize_bedrock_client(self) -> ChatBedrock:
         """Configure and return the Bedrock LLM instance."""
-        # Create Bedrock runtime client
-        bedrock_client = boto3.client(
-            service_name="bedrock-runtime",
-            region_name=self._region
-        )
-        
         return ChatBedrock(
-            client=bedrock_client,
+            client=_get_bedrock_client(self._region),
             model_id=self._model_id,
             model_kwargs={
                 "temperature": self.DEFAULT_TEMPERATURE,
@@ -84,20 +108,27 @@ class IntelligentResponder:
 
     def _build_rag_pipeline(self):
         """Construct the retrieval-augmented generation chain."""
-        prompt_template = ChatPromptTemplate.from_messages([
-            ("system", ASSISTANT_SYSTEM_PROMPT),
-            ("human", "{input}")
-        ])
-        
         retriever = self._knowledge_store.create_retriever()
         
         document_chain = create_stuff_documents_chain(
             self._llm,
-            prompt_template
+            _PROMPT_TEMPLATE
         )
         
         return create_retrieval_chain(retriever, document_chain)
 
+    def get_cached_response(self, user_message: str) -> Optional[str]:
+        """
+        Return the cached answer for a message without querying the model.
+
+        Args:
+            user_message: The user's question or message.
+
+        Returns:
+            Cached answer, or None if caching is disabled or it's a miss.
+        """
+        return self._response_cache.get(normalize_query(user_message))
+
     def generate_response(self, user_message: str) -> str:
         """
         Process a user query and generate an informed response.
@@ -108,12 +139,19 @@ class IntelligentResponder:
         Returns:
             Generated response string.
         """
-        logger.debug(f"Processing query: {user_message[:50]}...")
+        logger.debug("Processing query: %.50s...", user_message)
+        
+        cache_key = normalize_query(user_message)
+        cached_answer = self._response_cache.get(cache_key)
+        if cached_answer is not None:
+            logger.debug("Serving cached response")
+            return cached_answer
         
         try:
             result = self._chain.invoke({"input": user_message})
             response_text = result.get("answer", "")
             
+            self._response_cache.set(cache_key, response_text)
             logger.debug("Response generated successfully")
             return response_text
             
@@ -121,6 +159,43 @@ class IntelligentResponder:
             logger.error(f"Error generating response: {error}")
             return self._generate_fallback_response()
 
+    def generate_response_stream(self, user_message: str) -> Iterator[str]:
+        """
+        Stream the response for a user query as it is generated.
+
+        Use this instead of generate_response when the caller can forward
+        partial text, so users see the first words without waiting for the
+        full answer.
+
+        Args:
+            user_message: The user's question or message.
+
+        Yields:
+            Successive fragments of the generated answer.
+        """
+        logger.debug("Streaming query: %.50s...", user_message)
+        
+        cache_key = normalize_query(user_message)
+        cached_answer = self._response_cache.get(cache_key)
+        if cached_answer is not None:
+            logger.debug("Serving cached response")
+            yield cached_answer
+            return
+        
+        try:
+            answer_fragments = []
+            for chunk in self._chain.stream({"input": user_message}):
+                answer_fragment = chunk.get("answer")
+                if answer_fragment:
+                    answer_fragments.append(answer_fragment)
+                    yield answer_fragment
+            
+            self._response_cache.set(cache_key, "".join(answer_fragments))
+                    
+        except Exception as error:
+            logger.error(f"Error streaming response: {error}")
+            yield self._generate_fallback_response()
+
     def _generate_fallback_response(self) -> str:
         """Return a graceful fallback message on errors."""
         return (
@@ -154,7 +229,9 @@ class IntelligentResponder:
 
 def create_conversation_engine(
     index_name: str,
-    model: str = None
+    model: str = None,
+    cache_size: int = 0,
+    cache_ttl: float = 3600
 ) -> IntelligentResponder:
     """
     Factory function to create a fully configured conversation engine.
@@ -162,6 +239,8 @@ def create_conversation_engine(
     Args:
         index_name: Name of the knowledge base index.
         model: Optional Bedrock model name.
+        cache_size: Number of answers to cache; 0 disables response caching.
+        cache_ttl: Seconds a cached answer stays valid.
 
     Returns:
         Ready-to-use IntelligentResponder instance.
@@ -171,5 +250,7 @@ def create_conversation_engine(
     
     return IntelligentResponder(
         knowledge_store=store,
-        model_name=model
+        model_name=model,
+        cache_size=cache_size,
+        cache_ttl=cache_ttl
     )
@@ -0,0 +1,100 @@
+"""
+Response Cache Module
+---------------------
+Bounded, time-limited cache for answers to repeated questions.
+Lets exact-match queries skip retrieval and generation entirely.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+ValueT = TypeVar("ValueT")
+
+
+def normalize_query(message: str) -> str:
+    """
+    Build a cache key that ignores case and whitespace differences.
+
+    Args:
+        message: Raw user message.
+
+    Returns:
+        Lower-cased message with runs of whitespace collapsed.
+    """
+    return " ".join(message.lower().split())
+
+
+class ResponseCache(Generic[ValueT]):
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+    A capacity of zero disables caching entirely.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached answers; 0 disables caching.
+            ttl_seconds: Seconds before a cached answer is considered stale.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, ValueT]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the cache stores anything at all."""
+        return self._max_entries > 0
+
+    def get(self, key: str) -> Optional[ValueT]:
+        """
+        Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Normalized cache key.
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: ValueT) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Normalized cache key.
+            value: Value to cache.
+        """
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -3,18 +3,24 @@ Vector Database Service - AWS OpenSearch Serverless
 ----------------------------------------------------
 Manages connections and operations with AWS OpenSearch Serverless.
 Provides semantic search capabilities using vector embeddings.
+A local FAISS index can stand in for OpenSearch during development.
 """
 
 import logging
 import os
 import time
-from typing import List, Optional
+from itertools import chain, islice
+from urllib.parse import urlsplit
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 import boto3
 from opensearchpy import OpenSearch, RequestsHttpConnection
+from opensearchpy.helpers import parallel_bulk
 from requests_aws4auth import AWS4Auth
-from langchain_community.vectorstores import OpenSearchVectorSearch
+from langchain_community.vectorstores import FAISS, OpenSearchVectorSearch
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain.schema import Document
+from langchain_core.vectorstores import VectorStore, VectorStoreRetriever
 
 from core.embedding_service import get_embedding_service
 
@@ -25,9 +31,22 @@ class KnowledgeStore:
     """
     AWS OpenSearch Serverless wrapper for vector storage and retrieval.
     Uses IAM authentication - no API keys required.
+
+    With the "faiss" backend the index lives on local disk instead, which
+    removes the network round trip from retrieval during development.
     """
 
+    BACKEND_OPENSEARCH = "aoss"
+    BACKEND_FAISS = "faiss"
+    DEFAULT_LOCAL_INDEX_PATH = "vector_index"
+
     VECTOR_DIMENSION = 384
+    EMBEDDING_BATCH_SIZE = 1024
+    BULK_CHUNK_SIZE = 500
+    INDEXING_WORKERS = 4
+    
+    # HTTPS connections kept per client; sized for concurrent requests
+    CONNECTION_POOL_SIZE = 32
     INDEX_SETTINGS = {
         "settings": {
             "index": {
@@ -40,10 +59,22 @@ class KnowledgeStore:
                 "vector_field": {
                     "type": "knn_vector",
                     "dimension": 384,
+                    # Embeddings are L2-normalized, so inner product equals
+                    # cosine similarity; fp16 scalar quantization halves
+                    # vector memory and needs no training step
                     "method": {
                         "name": "hnsw",
-                        "space_type": "cosinesimil",
-                        "engine": "nmslib"
+                        "space_type": "innerproduct",
+                        "engine": "faiss",
+                        "parameters": {
+                            "ef_construction": 256,
+                            "ef_search": 100,
+                            "m": 16,
+                            "encoder": {
+                                "name": "sq",
+                                "parameters": {"type": "fp16"}
+                            }
+                        }
                     }
                 },
                 "text": {"type": "text"},
@@ -56,7 +87,9 @@ class KnowledgeStore:
         self,
         index_identifier: str,
         opensearch_endpoint: str = None,
-        aws_region: str = None
+        aws_region: str = None,
+        backend: str = None,
+        local_index_path: str = None
     ) -> None:
         """
         Initialize connection to OpenSearch Serverless.
@@ -65,8 +98,35 @@ class KnowledgeStore:
             index_identifier: Name of the vector index.
             opensearch_endpoint: OpenSearch endpoint URL.
             aws_region: AWS region for the service.
+            backend: "aoss" for OpenSearch Serverless or "faiss" for a local
+                index. Uses VECTOR_BACKEND env var if not provided.
+            local_index_path: Directory holding the local FAISS index.
+                Uses LOCAL_INDEX_PATH env var if not provided.
         """
         self._index_name = index_identifier
+        self._backend = (
+            backend or os.getenv("VECTOR_BACKEND", self.BACKEND_OPENSEARCH)
+        ).lower()
+        self._local_index_path = local_index_path or os.getenv(
+            "LOCAL_INDEX_PATH", self.DEFAULT_LOCAL_INDEX_PATH
+        )
+        self._embedding_service = get_embedding_service()
+        self._vector_store: Optional[VectorStore] = None
+        self._retrievers: Dict[int, VectorStoreRetriever] = {}
+        
+        if self._backend == self.BACKEND_FAISS:
+            self._client = None
+            logger.info(
+                f"Initialized local FAISS knowledge store: {self._index_name}"
+            )
+            return
+        
+        if self._backend != self.BACKEND_OPENSEARCH:
+            raise ValueError(
+                f"Unknown vector backend '{self._backend}'. "
+                f"Use '{self.BACKEND_OPENSEARCH}' or '{self.BACKEND_FAISS}'."
+            )
+        
         self._endpoint = opensearch_endpoint or os.getenv("OPENSEARCH_ENDPOINT")
         self._region = aws_region or os.getenv("AWS_REGION", "us-east-1")
         
@@ -76,33 +136,37 @@ class KnowledgeStore:
                 "Set OPENSEARCH_ENDPOINT environment variable."
             )
         
-        self._embedding_service = get_embedding_service()
+        # Parse the endpoint once; it may be given with or without a scheme
+        if not self._endpoint.startswith(("http://", "https://")):
+            parsed_endpoint = urlsplit(f"https://{self._endpoint}")
+        else:
+            parsed_endpoint = urlsplit(self._endpoint)
+        self._host = parsed_endpoint.hostname
+        self._port = parsed_endpoint.port or 443
+        self._opensearch_url = f"https://{self._host}:{self._port}"
+        
+        # Resolve the credential provider once (the chain may hit IMDS on
+        # EC2); the signer reads the current keys from it on every request,
+        # so rotated STS and instance-role tokens are picked up automatically
+        self._aws_auth = AWS4Auth(
+            region=self._region,
+            service="aoss",  # OpenSearch Serverless service
+            refreshable_credentials=boto3.Session().get_credentials()
+        )
+        
         self._client = self._create_client()
-        self._vector_store: Optional[OpenSearchVectorSearch] = None
 
         logger.info(f"Initialized knowledge store: {self._index_name}")
 
     def _create_client(self) -> OpenSearch:
         """Create authenticated OpenSearch client using IAM."""
-        credentials = boto3.Session().get_credentials()
-        
-        auth = AWS4Auth(
-            credentials.access_key,
-            credentials.secret_key,
-            self._region,
-            "aoss",  # OpenSearch Serverless service
-            session_token=credentials.token
-        )
-        
-        # Clean endpoint URL
-        host = self._endpoint.replace("https://", "").replace("http://", "")
-        
         return OpenSearch(
-            hosts=[{"host": host, "port": 443}],
-            http_auth=auth,
+            hosts=[{"host": self._host, "port": self._port}],
+            http_auth=self._aws_auth,
             use_ssl=True,
             verify_certs=True,
             connection_class=RequestsHttpConnection,
+            pool_maxsize=self.CONNECTION_POOL_SIZE,
             timeout=30
         )
 
@@ -124,103 +188,204 @@ class KnowledgeStore:
             logger.error(f"Error creating index: {e}")
             raise
 
-    def index_documents(self, document_chunks: List[Document]) -> None:
+    def index_documents(self, document_chunks: Iterable[Document]) -> int:
         """
         Store document chunks in the vector index.
 
+        Chunks are consumed lazily, one embedding batch at a time, so a
+        generator pipeline never has more than a batch in memory.
+
         Args:
             document_chunks: Pre-processed document chunks to index.
+
+        Returns:
+            Number of chunks successfully indexed.
         """
-        if not document_chunks:
+        chunk_iterator = iter(document_chunks)
+        first_batch = list(islice(chunk_iterator, self.EMBEDDING_BATCH_SIZE))
+        
+        if not first_batch:
             logger.warning("No documents provided for indexing")
-            return
+            return 0
+        
+        if self._backend == self.BACKEND_FAISS:
+            return self._index_documents_locally(chain(first_batch, chunk_iterator))
 
         self.ensure_index_exists()
         
-        logger.info(f"Indexing {len(document_chunks)} document chunks...")
+        logger.info("Indexing document chunks...")
         
-        # Create vector store and add documents
-        self._vector_store = OpenSearchVectorSearch(
-            index_name=self._index_name,
-            embedding_function=self._embedding_service.get_embeddings_interface(),
-            opensearch_url=f"https://{self._endpoint.replace('https://', '')}",
-            http_auth=self._get_aws_auth(),
-            use_ssl=True,
-            verify_certs=True,
-            connection_class=RequestsHttpConnection
-        )
+        # Embed in large batches and stream straight into the bulk API;
+        # uploads run on worker threads while the next batch is embedded
+        actions = self._build_index_actions(chain(first_batch, chunk_iterator))
+        indexed_count = 0
+        
+        for success, _ in parallel_bulk(
+            self._client,
+            actions,
+            thread_count=self.INDEXING_WORKERS,
+            chunk_size=self.BULK_CHUNK_SIZE
+        ):
+            indexed_count += success
+        
+        logger.info(f"Document indexing complete ({indexed_count} chunks)")
+        return indexed_count
+
+    def _index_documents_locally(self, document_chunks: Iterable[Document]) -> int:
+        """
+        Build the local FAISS index batch by batch and save it to disk.
+
+        The index is rebuilt from scratch, replacing any previous one.
+        """
+        logger.info(f"Building local FAISS index in: {self._local_index_path}")
         
-        # Add documents in batches
-        batch_size = 100
-        for i in range(0, len(document_chunks), batch_size):
-            batch = document_chunks[i:i + batch_size]
+        embeddings = self._embedding_service.get_embeddings_interface()
+        chunk_iterator = iter(document_chunks)
+        vector_store: Optional[FAISS] = None
+        indexed_count = 0
+        
+        while True:
+            batch = list(islice(chunk_iterator, self.EMBEDDING_BATCH_SIZE))
+            if not batch:
+                break
+            
             texts = [doc.page_content for doc in batch]
+            text_embeddings = zip(
+                texts, self._embedding_service.generate_batch_embeddings(texts)
+            )
             metadatas = [doc.metadata for doc in batch]
-            self._vector_store.add_texts(texts=texts, metadatas=metadatas)
-            logger.debug(f"Indexed batch {i // batch_size + 1}")
-        
-        logger.info("Document indexing complete")
-
-    def _get_aws_auth(self):
-        """Get AWS4Auth for OpenSearch requests."""
-        credentials = boto3.Session().get_credentials()
-        return AWS4Auth(
-            credentials.access_key,
-            credentials.secret_key,
-            self._region,
-            "aoss",
-            session_token=credentials.token
-        )
+            
+            if vector_store is None:
+                # Embeddings are L2-normalized, matching the OpenSearch
+                # index's inner-product space
+                vector_store = FAISS.from_embeddings(
+                    text_embeddings,
+                    embeddings,
+                    metadatas=metadatas,
+                    distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+                )
+            else:
+                vector_store.add_embeddings(text_embeddings, metadatas=metadatas)
+            indexed_count += len(batch)
+        
+        vector_store.save_local(self._local_index_path, index_name=self._index_name)
+        self._vector_store = vector_store
+        self._retrievers.clear()
+        
+        logger.info(f"Document indexing complete ({indexed_count} chunks)")
+        return indexed_count
+
+    def _build_index_actions(
+        self,
+        document_chunks: Iterable[Document]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Embed chunks batch by batch and yield bulk index actions.
 
-    def connect_to_existing(self) -> OpenSearchVectorSearch:
+        Documents use the same field layout as OpenSearchVectorSearch, so
+        the langchain retriever can query them.
+        """
+        chunk_iterator = iter(document_chunks)
+        batch_number = 0
+        
+        while True:
+            batch = list(islice(chunk_iterator, self.EMBEDDING_BATCH_SIZE))
+            if not batch:
+                break
+            
+            vectors = self._embedding_service.generate_batch_embeddings(
+                [doc.page_content for doc in batch]
+            )
+            batch_number += 1
+            logger.debug("Embedded batch %d", batch_number)
+            
+            for doc, vector in zip(batch, vectors):
+                yield {
+                    "_index": self._index_name,
+                    "_source": {
+                        "vector_field": vector.tolist(),
+                        "text": doc.page_content,
+                        "metadata": doc.metadata
+                    }
+                }
+
+    def connect_to_existing(self) -> VectorStore:
         """
         Connect to an existing vector index.
 
         Returns:
             Vector store instance connected to the index.
         """
-        self._vector_store = OpenSearchVectorSearch(
+        if self._backend == self.BACKEND_FAISS:
+            # The docstore is pickled; the index is written by this service
+            self._vector_store = FAISS.load_local(
+                self._local_index_path,
+                self._embedding_service.get_embeddings_interface(),
+                index_name=self._index_name,
+                # save_local() doesn't persist the strategy used at build time
+                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+                allow_dangerous_deserialization=True
+            )
+        else:
+            self._vector_store = self._connect_to_opensearch()
+        
+        # Retrievers bound to a previous vector store are stale
+        self._retrievers.clear()
+        
+        logger.debug(f"Connected to existing index: {self._index_name}")
+        return self._vector_store
+
+    def _connect_to_opensearch(self) -> OpenSearchVectorSearch:
+        """Create a langchain vector store over the OpenSearch index."""
+        return OpenSearchVectorSearch(
             index_name=self._index_name,
             embedding_function=self._embedding_service.get_embeddings_interface(),
-            opensearch_url=f"https://{self._endpoint.replace('https://', '')}",
-            http_auth=self._get_aws_auth(),
+            opensearch_url=self._opensearch_url,
+            http_auth=self._aws_auth,
             use_ssl=True,
             verify_certs=True,
-            connection_class=RequestsHttpConnection
+            connection_class=RequestsHttpConnection,
+            pool_maxsize=self.CONNECTION_POOL_SIZE
         )
-        
-        logger.debug(f"Connected to existing index: {self._index_name}")
-        return self._vector_store
 
-    def create_retriever(self, result_count: int = 3):
+    def create_retriever(self, result_count: int = 3) -> VectorStoreRetriever:
         """
         Create a retriever for semantic search operations.
 
+        Retrievers are cached per result count, so repeated calls reuse the
+        same connection instead of reconnecting.
+
         Args:
             result_count: Number of results to return per query.
 
         Returns:
             Retriever instance for RAG pipelines.
         """
+        retriever = self._retrievers.get(result_count)
+        if retriever is not None:
+            return retriever
+        
         if self._vector_store is None:
             self.connect_to_existing()
         
-        return self._vector_store.as_retriever(
+        retriever = self._vector_store.as_retriever(
             search_type="similarity",
             search_kwargs={"k": result_count}
         )
+        self._retrievers[result_count] = retriever
+        return retriever
 
 
 def initialize_knowledge_base(
     index_name: str,
-    document_chunks: List[Document]
+    document_chunks: Iterable[Document]
 ) -> KnowledgeStore:
     """
     One-shot initialization of the knowledge base with documents.
 
     Args:
         index_name: Name for the vector index.
-        document_chunks: Documents to store.
+        document_chunks: Documents to store; may be a lazy iterator.
 
     Returns:
         Configured KnowledgeStore instance.
@@ -0,0 +1,78 @@
+"""
+Tests for the embedding service.
+
+A fake SentenceTransformer stands in for the real model so the
+HuggingFaceEmbeddings wrapper runs end to end without downloading weights.
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from core.embedding_service import EmbeddingGenerator
+
+
+class FakeSentenceTransformer:
+    """Mimics the parts of SentenceTransformer the wrapper calls."""
+
+    def __init__(self, model_name_or_path, **kwargs):
+        self.model_name = model_name_or_path
+        self.encode_calls = []
+
+    def encode(self, sentences, show_progress_bar=None, **kwargs):
+        self.encode_calls.append(
+            {"sentences": list(sentences), "show_progress_bar": show_progress_bar, **kwargs}
+        )
+        return np.array(
+            [[float(len(text)), 1.0, 0.0] for text in sentences],
+            dtype=np.float32
+        )
+
+
+@pytest.fixture
+def fake_sentence_transformers(monkeypatch):
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return module
+
+
+@pytest.fixture
+def generator(fake_sentence_transformers, tmp_path):
+    return EmbeddingGenerator(
+        batch_size=8,
+        cache_directory=str(tmp_path / "cache"),
+        quantized=False
+    )
+
+
+def _client(generator: EmbeddingGenerator) -> FakeSentenceTransformer:
+    return generator.get_embeddings_interface().underlying_embeddings.client
+
+
+def test_embed_documents_through_wrapper(generator):
+    vectors = generator.generate_batch_embeddings(["a", "bbb", "a"])
+
+    assert vectors.shape == (3, 3)
+    assert vectors[:, 0].tolist() == [1.0, 3.0, 1.0]
+
+    call = _client(generator).encode_calls[0]
+    assert call["show_progress_bar"] is False
+    assert call["batch_size"] == 8
+    assert call["normalize_embeddings"] is True
+
+
+def test_warmup_and_query(generator):
+    generator.warmup()
+
+    assert generator.generate_embedding("hello") == [5.0, 1.0, 0.0]
+
+
+def test_cached_texts_are_not_re_encoded(generator):
+    generator.generate_batch_embeddings(["alpha", "beta"])
+    generator.generate_batch_embeddings(["alpha", "beta", "gamma"])
+
+    encoded = [call["sentences"] for call in _client(generator).encode_calls]
+    assert encoded == [["alpha", "beta"], ["gamma"]]
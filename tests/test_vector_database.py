@@ -0,0 +1,83 @@
+"""
+Tests for the local FAISS backend of the knowledge store.
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+from langchain.schema import Document
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.embeddings import Embeddings
+
+from services import vector_database
+from services.vector_database import KnowledgeStore
+
+VOCABULARY = ["fever", "cough", "rash", "headache"]
+
+
+def _embed(text: str) -> np.ndarray:
+    """Bag-of-words vector over VOCABULARY, L2-normalized like MiniLM's."""
+    vector = np.array(
+        [float(word in text.split()) for word in VOCABULARY] + [0.1],
+        dtype=np.float32
+    )
+    return vector / np.linalg.norm(vector)
+
+
+class FakeEmbeddings(Embeddings):
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [_embed(text).tolist() for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return _embed(text).tolist()
+
+
+class FakeEmbeddingService:
+    """Stands in for EmbeddingGenerator without loading a model."""
+
+    def __init__(self) -> None:
+        self._embeddings = FakeEmbeddings()
+
+    def get_embeddings_interface(self) -> Embeddings:
+        return self._embeddings
+
+    def generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self._embeddings.embed_documents(texts), dtype=np.float32)
+
+
+@pytest.fixture
+def make_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        vector_database, "get_embedding_service", FakeEmbeddingService
+    )
+
+    def factory() -> KnowledgeStore:
+        return KnowledgeStore(
+            "test-index",
+            backend=KnowledgeStore.BACKEND_FAISS,
+            local_index_path=str(tmp_path / "index")
+        )
+
+    return factory
+
+
+def test_faiss_index_round_trip_keeps_inner_product(make_store):
+    documents = [
+        Document(page_content="fever cough", metadata={"origin": "a.pdf"}),
+        Document(page_content="rash", metadata={"origin": "b.pdf"}),
+        Document(page_content="headache fever", metadata={"origin": "c.pdf"}),
+    ]
+    assert make_store().index_documents(documents) == 3
+
+    reloaded = make_store().connect_to_existing()
+
+    assert reloaded.distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT
+
+    results = reloaded.similarity_search_with_score("fever cough", k=3)
+    top_document, top_score = results[0]
+    assert top_document.metadata == {"origin": "a.pdf"}
+    # Identical normalized vectors have an inner product of 1
+    assert top_score == pytest.approx(1.0, abs=1e-5)
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
@@ -3,3 +3,12 @@
 """
 Web layer modules for HTTP interface and API endpoints.
 """
+
+import os
+
+# Each server worker/thread handles its own request, so numeric libraries
+# get one compute thread apiece instead of one per core. This runs before
+# any web module imports numpy/torch/tokenizers; explicit settings win.
+for _thread_variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_thread_variable, "1")
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
@@ -6,20 +6,35 @@ Coordinates between web layer and AWS-native services.
 """
 
 import logging
-from typing import Dict, Any
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator
 
 from services.conversation_engine import create_conversation_engine, IntelligentResponder
 from config.settings import get_settings
+from web.schemas import MAX_MESSAGE_LENGTH, MIN_MESSAGE_LENGTH
 
 logger = logging.getLogger(__name__)
 
 
+class ServerBusyError(RuntimeError):
+    """Raised when every LLM slot stays occupied past the wait timeout."""
+
+
 class ChatHandler:
     """
     Handles chat-related requests and coordinates with conversation engine.
     Uses AWS Bedrock for LLM and OpenSearch for retrieval.
     """
 
+    # Seconds a request waits for a free LLM slot before being rejected;
+    # kept short so waiters don't pin server threads themselves
+    SLOT_TIMEOUT_SECONDS = 1
+
+    # Server threads kept free of LLM calls for /health and /status
+    RESERVED_THREADS = 2
+
     def __init__(self) -> None:
         """Initialize the chat handler with AWS-native conversation engine."""
         settings = get_settings()
@@ -28,11 +43,53 @@ class ChatHandler:
         
         self._responder = create_conversation_engine(
             index_name=settings.database.index_name,
-            model=settings.llm.model_name
+            model=settings.llm.model_name,
+            cache_size=settings.llm.response_cache_size,
+            cache_ttl=settings.llm.response_cache_ttl
+        )
+        
+        # Bounds in-flight Bedrock calls so latency spikes can't pin
+        # every server thread
+        slot_count = self._slot_count(
+            settings.llm.max_concurrency, settings.server.threads
         )
+        self._llm_slots = threading.BoundedSemaphore(slot_count)
+        logger.debug("LLM concurrency limit: %d", slot_count)
         
         logger.info("Chat handler ready (AWS Bedrock + OpenSearch)")
 
+    @classmethod
+    def _slot_count(cls, configured: int, server_threads: int) -> int:
+        """
+        Size the LLM limit from the server's request thread pool.
+
+        Args:
+            configured: LLM_MAX_CONCURRENCY; 0 means derive from the threads.
+            server_threads: Request threads per server worker.
+
+        Returns:
+            Number of concurrent LLM calls allowed, at least 1.
+        """
+        thread_limit = max(1, server_threads - cls.RESERVED_THREADS)
+        if configured <= 0:
+            return thread_limit
+        return min(configured, thread_limit)
+
+    @contextmanager
+    def _llm_slot(self) -> Iterator[None]:
+        """
+        Hold one of the bounded LLM slots for the duration of a call.
+
+        Raises:
+            ServerBusyError: If no slot frees up within SLOT_TIMEOUT_SECONDS.
+        """
+        if not self._llm_slots.acquire(timeout=self.SLOT_TIMEOUT_SECONDS):
+            raise ServerBusyError("All LLM slots are busy")
+        try:
+            yield
+        finally:
+            self._llm_slots.release()
+
     def handle_user_message(self, message: str) -> Dict[str, Any]:
         """
         Process a user message and generate a response.
@@ -42,24 +99,59 @@ class ChatHandler:
 
         Returns:
             Dictionary with answer and success status.
+
+        Raises:
+            ServerBusyError: If the LLM is saturated.
         """
-        try:
-            answer = self._responder.generate_response(message)
-            
+        # Repeated questions are answered without taking an LLM slot
+        cached_answer = self._responder.get_cached_response(message)
+        if cached_answer is not None:
             return {
                 "success": True,
-                "answer": answer,
+                "answer": cached_answer,
                 "message_received": message
             }
-            
-        except Exception as error:
-            logger.error(f"Error handling message: {error}")
-            
-            return {
-                "success": False,
-                "answer": self._generate_error_response(),
-                "error": str(error)
-            }
+        
+        with self._llm_slot():
+            try:
+                answer = self._responder.generate_response(message)
+                
+                return {
+                    "success": True,
+                    "answer": answer,
+                    "message_received": message
+                }
+                
+            except Exception as error:
+                logger.error(f"Error handling message: {error}")
+                
+                return {
+                    "success": False,
+                    "answer": self._generate_error_response(),
+                    "error": str(error)
+                }
+
+    def stream_user_message(self, message: str) -> Iterator[str]:
+        """
+        Process a user message and stream the response as it is generated.
+
+        Args:
+            message: User's input message.
+
+        Yields:
+            Fragments of the answer text.
+        """
+        cached_answer = self._responder.get_cached_response(message)
+        if cached_answer is not None:
+            yield cached_answer
+            return
+        
+        try:
+            with self._llm_slot():
+                yield from self._responder.generate_response_stream(message)
+        except ServerBusyError:
+            # Headers are already sent, so report it in the stream itself
+            yield self._generate_busy_response()
 
     def handle_detailed_query(self, message: str) -> Dict[str, Any]:
         """
@@ -70,34 +162,43 @@ class ChatHandler:
 
         Returns:
             Detailed response including context information.
+
+        Raises:
+            ServerBusyError: If the LLM is saturated.
         """
-        try:
-            detailed_response = self._responder.get_detailed_response(message)
-            
-            # Format context for JSON serialization
-            context_summary = []
-            for doc in detailed_response.get("context", []):
-                context_summary.append({
-                    "content_preview": doc.page_content[:200] + "...",
-                    "source": doc.metadata.get("origin", "unknown")
-                })
-            
-            return {
-                "success": True,
-                "answer": detailed_response["answer"],
-                "sources": context_summary,
-                "query": message
-            }
-            
-        except Exception as error:
-            logger.error(f"Error in detailed query: {error}")
-            
-            return {
-                "success": False,
-                "answer": self._generate_error_response(),
-                "sources": [],
-                "error": str(error)
-            }
+        with self._llm_slot():
+            try:
+                detailed_response = self._responder.get_detailed_response(message)
+                
+                # Format context for JSON serialization
+                context_summary = []
+                for doc in detailed_response.get("context", []):
+                    # Preview is precomputed at indexing time; older indexes lack it
+                    preview = (
+                        doc.metadata.get("preview")
+                        or doc.page_content[:200] + "..."
+                    )
+                    context_summary.append({
+                        "content_preview": preview,
+                        "source": doc.metadata.get("origin", "unknown")
+                    })
+                
+                return {
+                    "success": True,
+                    "answer": detailed_response["answer"],
+                    "sources": context_summary,
+                    "query": message
+                }
+                
+            except Exception as error:
+                logger.error(f"Error in detailed query: {error}")
+                
+                return {
+                    "success": False,
+                    "answer": self._generate_error_response(),
+                    "sources": [],
+                    "error": str(error)
+                }
 
     def _generate_error_response(self) -> str:
         """Generate a user-friendly error message."""
@@ -106,12 +207,22 @@ class ChatHandler:
             "Please try again, or rephrase your question."
         )
 
+    def _generate_busy_response(self) -> str:
+        """Generate a user-friendly message for an overloaded service."""
+        return (
+            "I'm handling a lot of questions right now. "
+            "Please try again in a moment."
+        )
+
 
 class InputValidator:
     """Validates and sanitizes user input."""
 
-    MAX_MESSAGE_LENGTH = 2000
-    MIN_MESSAGE_LENGTH = 1
+    MAX_MESSAGE_LENGTH = MAX_MESSAGE_LENGTH
+    MIN_MESSAGE_LENGTH = MIN_MESSAGE_LENGTH
+
+    # Matches the first non-whitespace character without copying the message
+    _NON_BLANK_PATTERN = re.compile(r"\S")
 
     @classmethod
     def validate_message(cls, message: str) -> tuple:
@@ -124,7 +235,7 @@ class InputValidator:
         Returns:
             Tuple of (is_valid, error_message or None).
         """
-        if not message or len(message.strip()) < cls.MIN_MESSAGE_LENGTH:
+        if not message or cls._NON_BLANK_PATTERN.search(message) is None:
             return False, "Message cannot be empty"
         
         if len(message) > cls.MAX_MESSAGE_LENGTH:
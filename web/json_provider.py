@@ -0,0 +1,55 @@
+"""
+JSON Provider Module
+--------------------
+Flask JSON provider backed by orjson.
+Serializes jsonify() and request JSON through orjson instead of the stdlib.
+"""
+
+import decimal
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+# Numpy arrays (e.g. embeddings) and integer keys serialize natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Convert types orjson doesn't handle natively, mirroring Flask's defaults."""
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Drop-in replacement for Flask's default JSON provider.
+    Dates, UUIDs and dataclasses are supported by orjson itself.
+    """
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments as a JSON response.
+
+        The body is written as the bytes orjson produces, skipping the
+        decode/encode round trip through str.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
@@ -6,9 +6,28 @@ Separates page routes from API routes using blueprints.
 """
 
 import logging
-from flask import Blueprint, render_template, request, jsonify
+import threading
+from typing import Any, Iterable, Iterator, Tuple
 
-from web.handlers import ChatHandler
+import orjson
+import ormsgpack
+from flask import (
+    Blueprint,
+    Flask,
+    Response,
+    current_app,
+    render_template,
+    request,
+    stream_with_context,
+)
+
+from pydantic import ValidationError
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from config.settings import get_settings
+
+from web.handlers import ChatHandler, ServerBusyError
+from web.schemas import ChatRequest
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +37,164 @@ pages_blueprint = Blueprint("pages", __name__)
 # Blueprint for API endpoints
 api_blueprint = Blueprint("api", __name__)
 
-# Lazy-initialized handler
-_chat_handler = None
+CHAT_HANDLER_KEY = "chat_handler"
+
+# Serializes deferred handler creation across request threads
+_chat_handler_lock = threading.Lock()
+
+_JSON_MIMETYPE = "application/json"
+_MSGPACK_MIMETYPE = "application/msgpack"
+
+_FORM_MIMETYPES = frozenset({
+    "application/x-www-form-urlencoded",
+    "multipart/form-data"
+})
+
+# /status never changes at runtime, so its body is serialized once
+_STATUS_BODY = orjson.dumps({
+    "api_version": "1.0.0",
+    "status": "operational",
+    "endpoints": [
+        "/api/chat",
+        "/api/chat/stream",
+        "/api/chat/detailed",
+        "/api/status"
+    ],
+    "max_request_bytes": get_settings().server.max_request_bytes
+})
+_STATUS_HEADERS = {
+    "Content-Type": "application/json",
+    "Cache-Control": "public, max-age=5"
+}
+
+
+def init_chat_handler(app: Flask) -> None:
+    """
+    Build the chat handler at startup so the first request doesn't pay for it.
+
+    Creating the handler connects to Bedrock and OpenSearch and loads the
+    embedding model. If that fails (e.g. AWS not configured yet), the error
+    is logged and initialization is retried on the first chat request.
+    """
+    try:
+        app.extensions[CHAT_HANDLER_KEY] = ChatHandler()
+    except Exception as error:
+        logger.error(f"Chat handler initialization deferred: {error}")
 
 
 def _get_chat_handler() -> ChatHandler:
-    """Lazy initialization of chat handler."""
-    global _chat_handler
-    if _chat_handler is None:
-        _chat_handler = ChatHandler()
-    return _chat_handler
+    """
+    Return the app's chat handler, creating it once if startup init failed.
+
+    The handler owns the LLM concurrency limit and the response cache, so
+    concurrent requests must share a single instance.
+    """
+    handler = current_app.extensions.get(CHAT_HANDLER_KEY)
+    if handler is not None:
+        return handler
+    
+    with _chat_handler_lock:
+        handler = current_app.extensions.get(CHAT_HANDLER_KEY)
+        if handler is None:
+            handler = ChatHandler()
+            current_app.extensions[CHAT_HANDLER_KEY] = handler
+        return handler
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """Serialize a payload into a JSON response via the app's JSON provider."""
+    response = current_app.json.response(payload)
+    response.status_code = status
+    return response
+
+
+def _negotiated_response(payload: Any) -> Response:
+    """
+    Serialize a payload as MessagePack if the client prefers it, else JSON.
+
+    JSON is listed first, so clients accepting anything (browsers, curl)
+    keep getting JSON.
+    """
+    best_match = request.accept_mimetypes.best_match(
+        [_JSON_MIMETYPE, _MSGPACK_MIMETYPE]
+    )
+    if best_match == _MSGPACK_MIMETYPE:
+        return Response(ormsgpack.packb(payload), mimetype=_MSGPACK_MIMETYPE)
+    
+    return _json_response(payload)
+
+
+def _parse_chat_request() -> ChatRequest:
+    """
+    Parse and validate the raw request body as a ChatRequest.
+
+    Raises:
+        ValidationError: If the body is not valid JSON or fails validation.
+    """
+    return ChatRequest.model_validate_json(request.get_data(cache=False))
+
+
+def _invalid_request_response(error: ValidationError) -> Response:
+    """Build the 400 response for a malformed or invalid JSON body."""
+    return _json_response({
+        "error": "Invalid request",
+        "details": error.errors(
+            include_url=False,
+            include_context=False,
+            include_input=False
+        ),
+        "success": False
+    }, 400)
+
+
+def _busy_response() -> Response:
+    """Build the 503 response returned while every LLM slot is busy."""
+    response = _json_response({
+        "error": "Server busy, please retry",
+        "success": False
+    }, 503)
+    response.headers["Retry-After"] = "5"
+    return response
+
+
+def _extract_chat_message() -> Tuple[str, bool]:
+    """
+    Read the chat message from the request body, parsing it only once.
+
+    Only genuine form submissions go through Werkzeug's form parser; any
+    other body is read once as raw bytes. Both are validated as a
+    ChatRequest, so form and JSON messages follow the same rules.
+
+    Returns:
+        Tuple of (message, whether the request was a form submission).
+
+    Raises:
+        ValidationError: If the body is malformed or the message is invalid.
+    """
+    if request.mimetype in _FORM_MIMETYPES:
+        form = request.form
+        chat_request = ChatRequest.model_validate(
+            {"message": form.get("message") or form.get("msg")}
+        )
+        return chat_request.message, True
+    
+    return _parse_chat_request().message, False
+
+
+def _to_server_sent_events(fragments: Iterable[str]) -> Iterator[bytes]:
+    """Wrap answer fragments as SSE messages, ending with a 'done' event."""
+    for fragment in fragments:
+        yield b"data: " + orjson.dumps({"token": fragment}) + b"\n\n"
+    yield b"event: done\ndata: {}\n\n"
+
+
+@api_blueprint.errorhandler(RequestEntityTooLarge)
+def request_too_large(error: RequestEntityTooLarge) -> Response:
+    """Reject oversized request bodies with a JSON error."""
+    return _json_response({
+        "error": "Request body too large",
+        "success": False
+    }, 413)
 
 
 # ============================================================================
@@ -43,7 +210,7 @@ def home_page():
 @pages_blueprint.route("/health")
 def health_check():
     """Simple health check endpoint."""
-    return jsonify({
+    return _json_response({
         "status": "healthy",
         "service": "HealthAI Assistant"
     })
@@ -66,30 +233,51 @@ def process_chat_message():
     """
     handler = _get_chat_handler()
     
-    # Handle form data (from HTML form)
-    user_message = request.form.get("message") or request.form.get("msg")
+    try:
+        user_message, is_form_submission = _extract_chat_message()
+    except ValidationError as error:
+        return _invalid_request_response(error)
     
-    # Handle JSON payload
-    if not user_message and request.is_json:
-        data = request.get_json()
-        user_message = data.get("message")
+    logger.debug("Processing message: %.50s...", user_message)
     
-    if not user_message:
-        logger.warning("Empty message received")
-        return jsonify({
-            "error": "No message provided",
-            "success": False
-        }), 400
+    try:
+        response = handler.handle_user_message(user_message)
+    except ServerBusyError:
+        return _busy_response()
     
-    logger.debug(f"Processing message: {user_message[:50]}...")
+    # Return plain text for form submissions (backward compat)
+    if is_form_submission:
+        return Response(response["answer"].encode(), mimetype="text/plain")
     
-    response = handler.handle_user_message(user_message)
+    return _json_response(response)
+
+
+@api_blueprint.route("/chat/stream", methods=["POST"])
+def stream_chat_message():
+    """
+    Stream the AI response as server-sent events while it is generated.
     
-    # Return plain text for form submissions (backward compat)
-    if request.form:
-        return response["answer"]
+    Expected payload:
+        - message: User's message text (form or JSON)
     
-    return jsonify(response)
+    Returns:
+        text/event-stream of ``data: {"token": ...}`` messages followed
+        by a final ``done`` event
+    """
+    handler = _get_chat_handler()
+    
+    try:
+        user_message, _ = _extract_chat_message()
+    except ValidationError as error:
+        return _invalid_request_response(error)
+    
+    events = _to_server_sent_events(handler.stream_user_message(user_message))
+    
+    return Response(
+        stream_with_context(events),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @api_blueprint.route("/chat/detailed", methods=["POST"])
@@ -97,28 +285,26 @@ def process_detailed_query():
     """
     Process queries and return detailed responses with sources.
     
-    Returns response with context information for transparency.
+    Returns response with context information for transparency, encoded
+    as MessagePack when the Accept header asks for application/msgpack.
     """
     handler = _get_chat_handler()
     
-    if not request.is_json:
-        return jsonify({"error": "JSON payload required"}), 400
-    
-    data = request.get_json()
-    user_message = data.get("message")
+    # The body is validated as JSON itself, so the content type isn't checked
+    try:
+        user_message = _parse_chat_request().message
+    except ValidationError as error:
+        return _invalid_request_response(error)
     
-    if not user_message:
-        return jsonify({"error": "Message field required"}), 400
+    try:
+        response = handler.handle_detailed_query(user_message)
+    except ServerBusyError:
+        return _busy_response()
     
-    response = handler.handle_detailed_query(user_message)
-    return jsonify(response)
+    return _negotiated_response(response)
 
 
 @api_blueprint.route("/status", methods=["GET"])
 def api_status():
     """Return API status and version information."""
-    return jsonify({
-        "api_version": "1.0.0",
-        "status": "operational",
-        "endpoints": ["/api/chat", "/api/chat/detailed", "/api/status"]
-    })
+    return Response(_STATUS_BODY, headers=_STATUS_HEADERS)
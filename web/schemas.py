@@ -0,0 +1,23 @@
+"""
+Request Schemas Module
+----------------------
+Pydantic models for validating API request bodies.
+JSON is parsed and validated in a single pass by pydantic-core.
+"""
+
+from pydantic import BaseModel, Field
+
+# Shared with InputValidator, which applies the same limits
+MIN_MESSAGE_LENGTH = 1
+MAX_MESSAGE_LENGTH = 2000
+
+
+class ChatRequest(BaseModel):
+    """JSON body accepted by the chat endpoints."""
+
+    message: str = Field(
+        min_length=MIN_MESSAGE_LENGTH,
+        max_length=MAX_MESSAGE_LENGTH,
+        # Must contain at least one non-whitespace character
+        pattern=r"\S"
+    )
@@ -3,15 +3,36 @@ Flask Web Server Module
 -----------------------
 Application factory for creating and configuring the Flask application.
 Implements blueprint-based architecture for modular routing.
+Also exposes an ASGI adapter for serving through uvicorn.
 """
 
+import atexit
 import logging
+import queue
+import secrets
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
 from flask import Flask
+from flask_compress import Compress
+from whitenoise import WhiteNoise
 
 from config.settings import get_settings
+from core.embedding_service import get_embedding_service
+from web.json_provider import OrjsonProvider
 
 logger = logging.getLogger(__name__)
 
+STATIC_FOLDER = "../assets/styles"
+STATIC_URL_PATH = "/styles"
+STATIC_MAX_AGE = 86400
+
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# One listener per process, shared by every app instance
+_log_listener: Optional[QueueListener] = None
+
 
 def create_application() -> Flask:
     """
@@ -22,28 +43,108 @@ def create_application() -> Flask:
     """
     settings = get_settings()
     
+    behind_proxy = settings.server.behind_proxy
+    
     app = Flask(
         __name__,
         template_folder="../assets/views",
-        static_folder="../assets/styles",
-        static_url_path="/styles"
+        static_folder=None if behind_proxy else STATIC_FOLDER,
+        static_url_path=STATIC_URL_PATH
     )
     
+    if behind_proxy:
+        # The reverse proxy serves /styles; the rule only builds url_for() links
+        app.add_url_rule(
+            f"{STATIC_URL_PATH}/<path:filename>",
+            endpoint="static",
+            build_only=True
+        )
+    else:
+        _serve_static_files(app)
+    
+    # Serialize jsonify() and request JSON through orjson
+    app.json = OrjsonProvider(app)
+    
     # Configure application
-    app.config["SECRET_KEY"] = "healthai-secure-key-change-in-production"
-    app.config["APP_NAME"] = settings.app_name
+    app.config.update(
+        SECRET_KEY=settings.secret_key or _generate_secret_key(),
+        APP_NAME=settings.app_name,
+        # Werkzeug rejects larger bodies with 413 before they are buffered
+        MAX_CONTENT_LENGTH=settings.server.max_request_bytes,
+        # Only responses worth the encode cost (e.g. /chat/detailed) are
+        # compressed; SSE streams must flush uncompressed
+        COMPRESS_ALGORITHM=["br", "gzip"],
+        COMPRESS_MIN_SIZE=1024,
+        COMPRESS_BR_LEVEL=4,
+        COMPRESS_LEVEL=6,
+        COMPRESS_STREAMS=False
+    )
+    Compress(app)
+    
+    # Accept "/api/chat/" as well as "/api/chat" instead of answering with
+    # a redirect; must be set before any rule is added
+    app.url_map.strict_slashes = False
     
     # Register blueprints
     _register_blueprints(app)
     
+    # Compile the route matcher now rather than on the first request
+    app.url_map.update()
+    
     # Configure logging
     _setup_logging(app, settings.server.debug)
     
+    # Load the embedding model and chat pipeline before the first request
+    _warmup_embeddings()
+    _initialize_services(app)
+    
     logger.info(f"Application '{settings.app_name}' initialized")
     
     return app
 
 
+def create_asgi_application():
+    """
+    Application factory for ASGI servers such as uvicorn.
+
+    Each request runs the Flask app on a pool of SERVER_THREADS worker
+    threads, so blocking Bedrock and OpenSearch calls neither stall the
+    event loop nor queue behind one another.
+    
+    Returns:
+        ASGI application wrapping the Flask app.
+    """
+    from a2wsgi import WSGIMiddleware
+    
+    return WSGIMiddleware(
+        create_application(),
+        workers=get_settings().server.threads
+    )
+
+
+def _generate_secret_key() -> str:
+    """Generate a per-process secret key when SECRET_KEY is not configured."""
+    logger.warning(
+        "SECRET_KEY is not set; using a random key that changes on restart"
+    )
+    return secrets.token_hex(32)
+
+
+def _serve_static_files(app: Flask) -> None:
+    """
+    Serve static assets through WhiteNoise instead of Flask's view.
+
+    Files are indexed once at startup and served before the request reaches
+    Flask, with long-lived cache headers.
+    """
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=app.static_folder,
+        prefix=STATIC_URL_PATH.lstrip("/") + "/",
+        max_age=STATIC_MAX_AGE
+    )
+
+
 def _register_blueprints(app: Flask) -> None:
     """Register all application blueprints."""
     from web.routes import api_blueprint, pages_blueprint
@@ -54,15 +155,55 @@ def _register_blueprints(app: Flask) -> None:
     logger.debug("Blueprints registered successfully")
 
 
+def _warmup_embeddings() -> None:
+    """
+    Load the embedding model ahead of the first request.
+
+    A failure (e.g. offline host, missing model) is logged and the model is
+    loaded lazily on first use instead, so the server still starts.
+    """
+    try:
+        get_embedding_service().warmup()
+    except Exception as error:
+        logger.warning(f"Embedding model warmup deferred: {error}")
+
+
+def _initialize_services(app: Flask) -> None:
+    """Eagerly construct request-path services."""
+    from web.routes import init_chat_handler
+    
+    init_chat_handler(app)
+
+
 def _setup_logging(app: Flask, debug: bool) -> None:
-    """Configure application logging."""
+    """
+    Configure application logging.
+
+    Request threads only enqueue records; a background listener thread
+    formats them and writes to stderr, so logging never blocks on I/O.
+    """
+    global _log_listener
+    
     log_level = logging.DEBUG if debug else logging.INFO
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
     
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    if _log_listener is None:
+        log_queue = queue.SimpleQueue()
+        
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+        
+        _log_listener = QueueListener(
+            log_queue, stream_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        # Flush queued records on interpreter shutdown
+        atexit.register(_log_listener.stop)
+        
+        root_logger.addHandler(QueueHandler(log_queue))
+    
+    app.extensions["log_listener"] = _log_listener
     
     # Suppress verbose library logs
     logging.getLogger("urllib3").setLevel(logging.WARNING)